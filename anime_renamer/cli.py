@@ -1,37 +1,67 @@
 ﻿from __future__ import annotations
 
 import csv
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
 
-from .config import load_config
-from .executor import apply_operations, rollback_from_log, write_log_jsonl, delete_empty_dirs
-from .parse import make_decision
-from .planner import make_operation
-from .scanner import list_media_files
+from .config import Config, load_config
+from .executor import apply_operations, rollback_from_log, delete_empty_dirs
+from .jsonio import dumps_pretty
+from .parse import Decision, make_decision
+from .planner import Operation, make_operation
+from .scanner import MediaFile, list_media_files
 
 app = typer.Typer(add_completion=False)
 
+# Folders classified concurrently when the Perplexity API is on. Each worker
+# makes at most one request at a time and pauses 0.2s after it.
+_API_WORKERS = 4
+
+
+def _plan_one(m: MediaFile, cfg: Config) -> tuple[Decision, Operation]:
+    dec = make_decision(m.path, cfg, m.size, m.mtime)
+    return dec, make_operation(dec, cfg, m.path)
+
+
+def _plan(media: list[MediaFile], cfg: Config) -> list[tuple[Decision, Operation]]:
+    # Local planning is CPU-bound; threads would only add overhead.
+    if not cfg.perplexity_enabled:
+        return [_plan_one(m, cfg) for m in media]
+
+    # With the API on, overlap network latency across folders. Each folder is
+    # planned in sorted order on one thread, so the file that gets the real API
+    # answer (and seeds the folder-series cache) is the same as a serial run.
+    folders: dict[Path, list[int]] = {}
+    for i, m in enumerate(media):
+        folders.setdefault(m.path.parent, []).append(i)
+
+    def plan_folder(idxs: list[int]) -> list[tuple[Decision, Operation]]:
+        return [_plan_one(media[i], cfg) for i in idxs]
+
+    results: list = [None] * len(media)
+    with ThreadPoolExecutor(max_workers=_API_WORKERS) as ex:
+        for idxs, planned in zip(folders.values(), ex.map(plan_folder, folders.values())):
+            for i, res in zip(idxs, planned):
+                results[i] = res
+    return results
+
 
 def _write_status_files(base: Path, rows: list[dict]) -> None:
     base.parent.mkdir(parents=True, exist_ok=True)
 
     # JSON
-    base.with_suffix(".json").write_text(
-        json.dumps(rows, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    base.with_suffix(".json").write_bytes(dumps_pretty(rows))
 
     # CSV
     csv_path = base.with_suffix(".csv")
     fieldnames = ["src", "dst", "decision_kind", "status"]
     with csv_path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k, "") for k in fieldnames})
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows(tuple(r.get(k, "") for k in fieldnames) for r in rows)
 
 
 @app.command()
@@ -44,9 +74,7 @@ def scan(config: Path = typer.Option(Path("config.yaml"), exists=True)) -> None:
         typer.echo("No media files found. Check paths.inbox_dir and rules.allowed_ext.")
         return
 
-    for m in media:
-        dec = make_decision(m.path, cfg)
-        op = make_operation(dec, cfg, m.path)
+    for dec, op in _plan(media, cfg):
         typer.echo(f"[{dec.kind}] {op.src} -> {op.dst}")
 
 
@@ -68,9 +96,7 @@ def apply(
     ops = []
     planned_rows: list[dict] = []
 
-    for m in media:
-        dec = make_decision(m.path, cfg)
-        op = make_operation(dec, cfg, m.path)
+    for dec, op in _plan(media, cfg):
         ops.append(op)
         planned_rows.append(
             {
@@ -81,28 +107,25 @@ def apply(
             }
         )
 
-    # Execute moves + write move log
-    records = apply_operations(ops, dry_run=False)
-    write_log_jsonl(log, records)
+    # Execute moves, streaming the move log and updating status rows as we go
+    apply_operations(ops, dry_run=False, log_path=log, rows=planned_rows, cfg=cfg)
     typer.echo(f"Wrote log: {log}")
 
-    # Build status: moved vs quarantined (based on final destination path)
-    quarantine_root = str(cfg.quarantine_dir.resolve()).lower()
+    # Build status: moved vs quarantined (based on final destination path).
+    # Destinations are built from cfg.quarantine_dir, so a string prefix check
+    # is enough; no need to resolve() every file.
+    quarantine_prefix = os.path.normcase(os.path.abspath(cfg.quarantine_dir)) + os.sep
     moved = 0
     quarantined = 0
     quarantined_files: list[str] = []
 
-    moved_map = {r["src"]: r["dst"] for r in records}
-
     for row in planned_rows:
-        final_dst = moved_map.get(row["src"], row["dst"])
-        row["dst"] = final_dst
-        row["status"] = "MOVED"
+        final_dst = row["dst"]
         moved += 1
 
-        if str(Path(final_dst).resolve()).lower().startswith(quarantine_root):
+        if os.path.normcase(os.path.abspath(final_dst)).startswith(quarantine_prefix):
             quarantined += 1
-            quarantined_files.append(Path(final_dst).name)
+            quarantined_files.append(os.path.basename(final_dst))
             row["status"] = "QUARANTINED"
 
     _write_status_files(status, planned_rows)
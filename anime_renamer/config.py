@@ -6,6 +6,9 @@ from typing import Dict, List
 
 import yaml
 
+# libyaml-backed loader when available; falls back to the pure-Python one.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass(frozen=True)
 class Config:
@@ -33,7 +36,7 @@ def _as_path(value: str | Path) -> Path:
 
 
 def load_config(path: Path) -> Config:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER) or {}
 
     paths = data.get("paths", {}) or {}
     rules = data.get("rules", {}) or {}
@@ -1,52 +1,133 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Set
 
+from .config import Config
+from .jsonio import dumps_line
 from .planner import Operation
 
 
+# Collisions usually clear within a few __dupN names; probe those directly and
+# only list the folder when a name is heavily duplicated.
+_DIRECT_PROBES = 8
+
+
 def _unique_destination(dst: Path) -> Path:
-    if not dst.exists():
+    if not os.path.lexists(dst):
         return dst
-    for i in range(1, 1000):
-        cand = dst.with_name(dst.stem + f"__dup{i}" + dst.suffix)
-        if not cand.exists():
+
+    def dup(i: int) -> str:
+        return dst.stem + f"__dup{i}" + dst.suffix
+
+    for i in range(1, _DIRECT_PROBES + 1):
+        cand = dst.with_name(dup(i))
+        if not os.path.lexists(cand):
+            return cand
+
+    # Many duplicates: list the folder once and skip names known to be taken.
+    # The pick is still confirmed on disk, since the set is case-sensitive
+    # while the filesystem may not be.
+    existing = {os.path.normcase(n) for n in os.listdir(dst.parent)}
+    for i in range(_DIRECT_PROBES + 1, 1000):
+        name = dup(i)
+        if os.path.normcase(name) in existing:
+            continue
+        cand = dst.with_name(name)
+        if not os.path.lexists(cand):
             return cand
     raise RuntimeError(f"Too many name collisions for: {dst}")
 
 
-def apply_operations(ops: Iterable[Operation], dry_run: bool) -> List[dict]:
+def _device(path: Path) -> int:
+    # Destination folders may not exist yet; use their nearest existing ancestor.
+    p = path.absolute()
+    while not p.exists() and p.parent != p:
+        p = p.parent
+    return os.stat(p).st_dev
+
+
+def _same_filesystem(*dirs: Path) -> bool:
+    try:
+        return len({_device(d) for d in dirs}) == 1
+    except OSError:
+        return False
+
+
+def _move(src: Path, dst: Path, same_fs: bool) -> None:
+    if same_fs:
+        # Plain rename: one syscall, no data copied.
+        try:
+            os.replace(src, dst)
+            return
+        except OSError:
+            pass  # e.g. a nested mount point; let shutil work it out
+    shutil.move(str(src), str(dst))
+
+
+def apply_operations(
+    ops: Iterable[Operation],
+    dry_run: bool,
+    log_path: Optional[Path] = None,
+    rows: Optional[List[dict]] = None,
+    cfg: Optional[Config] = None,
+) -> List[dict]:
+    """
+    Move each operation's source to its (de-duplicated) destination.
+    If log_path is given, each record is appended to it as JSONL right after
+    its move, so an interrupted run still leaves a log that rollback can use.
+    If rows is given (one status row per op, same order), each row's "dst" and
+    "status" are updated in place as its move completes.
+    If cfg is given and inbox, destination and quarantine share a filesystem,
+    files are moved with os.replace instead of shutil.move.
+    """
+    same_fs = (
+        cfg is not None
+        and not dry_run
+        and _same_filesystem(cfg.inbox_dir, cfg.dest_root, cfg.quarantine_dir)
+    )
     log: List[dict] = []
-    for op in ops:
-        dst = op.dst
-        record = {"action": op.kind, "src": str(op.src), "dst": str(dst)}
+    sink = log_path.open("wb", buffering=1 << 20) if log_path else None
+    try:
+        for i, op in enumerate(ops):
+            dst = op.dst
+            record = {"action": op.kind, "src": str(op.src), "dst": str(dst)}
 
-        if dry_run:
-            log.append(record)
-            continue
+            if not dry_run:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                final = _unique_destination(dst)
+                record["dst"] = str(final)
+                _move(op.src, final, same_fs)
+
+            if rows is not None:
+                rows[i]["dst"] = record["dst"]
+                if not dry_run:
+                    rows[i]["status"] = "MOVED"
 
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        final = _unique_destination(dst)
-        record["dst"] = str(final)
-        shutil.move(str(op.src), str(final))
-        log.append(record)
+            log.append(record)
+            if sink is not None:
+                sink.write(dumps_line(record))
+    finally:
+        if sink is not None:
+            sink.close()
 
     return log
 
 
 def write_log_jsonl(log_path: Path, records: List[dict]) -> None:
-    log_path.write_text(
-        "\n".join(json.dumps(r, ensure_ascii=False) for r in records) + "\n",
-        encoding="utf-8",
-    )
+    log_path.write_bytes(b"".join(dumps_line(r) for r in records))
 
 
 def rollback_from_log(log_path: Path) -> None:
-    lines = log_path.read_text(encoding="utf-8").splitlines()
-    records = [json.loads(x) for x in lines if x.strip()]
+    records: List[dict] = []
+    with log_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
     for r in reversed(records):
         src = Path(r["src"])
         dst = Path(r["dst"])
@@ -62,13 +143,18 @@ def delete_empty_dirs(root: Path) -> int:
     """
     root = root.resolve()
     deleted = 0
-    # Walk bottom-up so children removed before parents
-    for p in sorted(root.rglob("*"), reverse=True):
-        if p.is_dir():
+    removed: Set[str] = set()
+    # os.walk(topdown=False) yields children before parents. Its dirnames are
+    # listed before the children are removed, so a folder counts as empty
+    # when it has no files and every subfolder was removed in this pass.
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        if dirpath == str(root) or filenames:
+            continue
+        if all(os.path.join(dirpath, d) in removed for d in dirnames):
             try:
-                next(p.iterdir())
-            except StopIteration:
-                # Empty dir
-                p.rmdir()
-                deleted += 1
+                os.rmdir(dirpath)
+            except OSError:
+                continue
+            removed.add(dirpath)
+            deleted += 1
     return deleted
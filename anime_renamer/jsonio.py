@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+# orjson is optional (pip install anime-renamer[fast]); it serializes straight
+# to bytes and is several times faster than stdlib json on these payloads.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_pretty(rows: List[Dict[str, Any]]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(rows, option=orjson.OPT_INDENT_2)
+    return json.dumps(rows, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dumps_line(record: Dict[str, Any]) -> bytes:
+    """One JSONL line, including the trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
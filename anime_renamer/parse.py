@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -30,11 +31,14 @@ class Decision:
     movie_year: Optional[int]
 
 
+_SANITIZE_TABLE = str.maketrans({c: " " for c in INVALID_CHARS})
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def sanitize_name(name: str) -> str:
-    s = str(name or "").strip()
-    for ch in INVALID_CHARS:
-        s = s.replace(ch, " ")
-    s = re.sub(r"\s+", " ", s).strip()
+    s = str(name or "").translate(_SANITIZE_TABLE)
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 
@@ -52,9 +56,13 @@ _NOISE_PATTERNS = [
     r"\b(season\s*\d{1,2})\b",
     r"\b(complete)\b",
 ]
-_BRACKETED = re.compile(r"[\[\(].*?[\]\)]")
+_NOISE_RE = re.compile("|".join(f"(?:{p})" for p in _NOISE_PATTERNS), re.IGNORECASE)
+# Negated character classes instead of a lazy ".*?": no backtracking, and
+# each tag closes with its own bracket type.
+_BRACKETED = re.compile(r"\[[^\]]*\]|\([^)]*\)")
 
 
+@lru_cache(maxsize=4096)
 def normalize_series_title(raw: str) -> str:
     s = str(raw or "").strip()
 
@@ -64,9 +72,8 @@ def normalize_series_title(raw: str) -> str:
     # unify separators
     s = s.replace(".", " ").replace("_", " ").replace("-", " ")
 
-    # remove noise tokens
-    for pat in _NOISE_PATTERNS:
-        s = re.sub(pat, " ", s, flags=re.IGNORECASE)
+    # remove noise tokens (single pass over the fused alternation)
+    s = _NOISE_RE.sub(" ", s)
 
     s = sanitize_name(s)
     if len(s) < 2:
@@ -74,18 +81,46 @@ def normalize_series_title(raw: str) -> str:
     return s
 
 
-def choose_series_name(raw_series: str, cfg: Config) -> str:
+@lru_cache(maxsize=4096)
+def _choose_series_name(raw_series: str, overrides: Tuple[Tuple[str, str], ...]) -> str:
+    # Keyed on the override contents (not the Config object), so every file in
+    # an episode batch shares one normalization per folder.
     cleaned = normalize_series_title(raw_series)
-    for k, v in cfg.series_overrides.items():
+    for k, v in overrides:
         if k.lower() in cleaned.lower():
             return sanitize_name(v)
     return cleaned
 
 
+def choose_series_name(raw_series: str, cfg: Config) -> str:
+    return _choose_series_name(raw_series, tuple(cfg.series_overrides.items()))
+
+
 def infer_series_from_context(file_path: Path) -> str:
     return file_path.parent.name
 
 
+def _fused(*patterns: re.Pattern) -> re.Pattern:
+    # Inline (?i) flags and duplicate group names can't be combined into one
+    # alternation, so strip them and apply IGNORECASE to the whole pattern.
+    parts = []
+    for p in patterns:
+        src = p.pattern
+        if src.startswith("(?i)"):
+            src = src[4:]
+        parts.append("(?:" + re.sub(r"\(\?P<\w+>", "(?:", src) + ")")
+    return re.compile("|".join(parts), re.IGNORECASE)
+
+
+# One search each for "looks like an episode number", special keywords and
+# extra keywords. Keywords keep the plain substring semantics ("NCOP1" is an extra)
+# and are matched case-sensitively against the upper-cased name, which is much
+# faster in `re` than an IGNORECASE alternation.
+_KIND_EP_RE = _fused(RE_SEASON_EP, RE_X, RE_DASH_EP)
+_SPECIAL_RE = re.compile("|".join(re.escape(k.upper()) for k in SPECIAL_KEYWORDS))
+_EXTRA_RE = re.compile("|".join(re.escape(k.upper()) for k in DEFAULT_EXTRA_KEYWORDS))
+
+
 def classify_kind(filename: str) -> str:
     """
     IMPORTANT RULE:
@@ -93,14 +128,12 @@ def classify_kind(filename: str) -> str:
     always treat it as an episode. This prevents OP/ED/SP keywords in the
     filename from pushing real episodes into specials/extras.
     """
-    stem = Path(filename).stem
-    if RE_SEASON_EP.search(stem) or RE_X.search(stem) or RE_DASH_EP.search(stem):
+    if _KIND_EP_RE.search(Path(filename).stem):
         return "episode"
-
     up = filename.upper()
-    if any(k in up for k in SPECIAL_KEYWORDS):
+    if _SPECIAL_RE.search(up):
         return "special"
-    if any(k in up for k in DEFAULT_EXTRA_KEYWORDS):
+    if _EXTRA_RE.search(up):
         return "extra"
     return "episode"
 
@@ -135,6 +168,9 @@ def parse_season_episode(stem: str, default_season: int) -> Tuple[Optional[int],
 
 
 def decide_extra_bucket(filename: str, cfg: Config) -> str:
+    # Kept as a linear scan: the first extras_map key (in config order) found
+    # anywhere in the name wins, which a fused alternation can't express, and
+    # `key in up` is already a C-level substring search.
     up = filename.upper()
     for key, bucket in cfg.extras_map.items():
         if key in up:
@@ -168,7 +204,9 @@ def _local_decision(path: Path, cfg: Config, series_name: str) -> Decision:
     )
 
 
-def make_decision(path: Path, cfg: Config) -> Decision:
+def make_decision(
+    path: Path, cfg: Config, size: Optional[int] = None, mtime: Optional[int] = None
+) -> Decision:
     # Always do local parsing first (fast, deterministic)
     raw_series_local = infer_series_from_context(path)
     series_name_local = choose_series_name(raw_series_local, cfg)
@@ -179,7 +217,7 @@ def make_decision(path: Path, cfg: Config) -> Decision:
 
     # API enhances series naming and helps with ova/movie detection.
     try:
-        d = classify_media(cfg, path)
+        d = classify_media(cfg, path, size, mtime)
     except Exception:
         return base
 
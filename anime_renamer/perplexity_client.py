@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TextIO
 
 import requests
 
@@ -28,13 +30,20 @@ class APIDecision:
 # Caching helpers
 # -------------------------
 
+# Guards the module-level caches, the cache file handle and the call counter;
+# the planner classifies different folders on separate threads.
+_LOCK = threading.RLock()
+
+
 def _cache_path(cfg: Config) -> Path:
     return Path("api-cache.jsonl")
 
 
-def _cache_key(file_path: Path) -> str:
-    st = file_path.stat()
-    return f"{file_path}|{st.st_size}|{int(st.st_mtime)}"
+def _cache_key(file_path: Path, size: Optional[int] = None, mtime: Optional[int] = None) -> str:
+    if size is None or mtime is None:
+        st = file_path.stat()
+        size, mtime = st.st_size, int(st.st_mtime)
+    return f"{file_path}|{size}|{mtime}"
 
 
 def _read_cache(cfg: Config) -> Dict[str, Dict[str, Any]]:
@@ -52,11 +61,38 @@ def _read_cache(cfg: Config) -> Dict[str, Dict[str, Any]]:
     return out
 
 
+# In-memory view of api-cache.jsonl, loaded once per process
+_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _load_cache_once(cfg: Config) -> Dict[str, Dict[str, Any]]:
+    global _CACHE
+    with _LOCK:
+        if _CACHE is None:
+            _CACHE = _read_cache(cfg)
+        return _CACHE
+
+
+# Append handle for api-cache.jsonl, opened on first write and kept for the run
+_CACHE_FH: Optional[TextIO] = None
+
+
+def _cache_handle(cfg: Config) -> TextIO:
+    global _CACHE_FH
+    if _CACHE_FH is None:
+        _CACHE_FH = _cache_path(cfg).open("a", encoding="utf-8", buffering=1 << 16)
+        atexit.register(_CACHE_FH.close)
+    return _CACHE_FH
+
+
 def _append_cache(cfg: Config, key: str, value: Dict[str, Any]) -> None:
-    p = _cache_path(cfg)
     rec = {"key": key, "value": value}
-    with p.open("a", encoding="utf-8") as f:
+    with _LOCK:
+        _load_cache_once(cfg)[key] = value
+        f = _cache_handle(cfg)
         f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        # Flush so paid API answers survive a crash; still far cheaper than open/close.
+        f.flush()
 
 
 def _pplx_call(cfg: Config, prompt: str) -> str:
@@ -114,36 +150,44 @@ def _get_max_calls(cfg: Config) -> int:
     return int(getattr(cfg, "perplexity_max_calls", -1) or -1)
 
 
-def classify_media(cfg: Config, file_path: Path) -> APIDecision:
+def classify_media(
+    cfg: Config, file_path: Path, size: Optional[int] = None, mtime: Optional[int] = None
+) -> APIDecision:
     """
     Classification with 3 layers:
     1) File cache from api-cache.jsonl (existing behavior).
     2) NEW: Folder-series cache: reuse series for other files in same folder.
     3) API call as last resort.
+
+    size/mtime come from the scanner when available; otherwise the file is stat()ed.
     """
     global _CALL_COUNT
 
-    cache = _read_cache(cfg)
-    key = _cache_key(file_path)
+    cache = _load_cache_once(cfg)
+    key = _cache_key(file_path, size, mtime)
 
     # 1) File-level cache hit
     if key in cache:
         return APIDecision(**cache[key])
 
     # 2) Folder-level reuse (big credit saver for episode batches)
-    folder_key = str(file_path.parent.resolve())
+    # Scanner paths all live under cfg.inbox_dir, so the plain path string is a
+    # stable key; no realpath() per file.
+    folder_key = os.fspath(file_path.parent)
     if folder_key in _FOLDER_SERIES_CACHE:
         # We still need to classify kind; but to save credits we keep it conservative.
         # Return unknown kind but with series set; parse.py will still normalize and
         # planner can quarantine unknowns safely.
         return APIDecision(kind="unknown", series=_FOLDER_SERIES_CACHE[folder_key])
 
-    # 3) Optional max call limiter
+    # 3) Optional max call limiter; the slot is reserved up front so threads can't overshoot
     max_calls = _get_max_calls(cfg)
     if max_calls == 0:
         raise RuntimeError("Perplexity disabled by perplexity_max_calls=0.")
-    if max_calls > 0 and _CALL_COUNT >= max_calls:
-        raise RuntimeError(f"Perplexity API call limit reached ({max_calls}).")
+    with _LOCK:
+        if max_calls > 0 and _CALL_COUNT >= max_calls:
+            raise RuntimeError(f"Perplexity API call limit reached ({max_calls}).")
+        _CALL_COUNT += 1
 
     parent_folder = file_path.parent.name
     filename = file_path.name
@@ -175,8 +219,12 @@ filename="{filename}"
 full_path="{str(file_path)}"
 """.strip()
 
-    raw = _pplx_call(cfg, prompt)
-    _CALL_COUNT += 1
+    try:
+        raw = _pplx_call(cfg, prompt)
+    except Exception:
+        with _LOCK:
+            _CALL_COUNT -= 1
+        raise
 
     value = _loads_json_maybe_wrapped(raw)
 
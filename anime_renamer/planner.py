@@ -18,58 +18,58 @@ def season_dirname(season: int) -> str:
     return f"Season {season:02d}"
 
 
-def episode_filename(series: str, season: int, ep: int, ext: str) -> str:
-    s = sanitize_name(series)
-    return f"{s} - S{season:02d}E{ep:02d}{ext}"
+# The *_filename / movie_dirname helpers expect names already passed through
+# sanitize_name; build_destination sanitizes once and reuses the result.
+def episode_filename(clean_series: str, season: int, ep: int, ext: str) -> str:
+    return f"{clean_series} - S{season:02d}E{ep:02d}{ext}"
 
 
-def ova_filename(series: str, ova_no: int, ext: str) -> str:
-    s = sanitize_name(series)
-    return f"{s} - OVA{ova_no:02d}{ext}"
+def ova_filename(clean_series: str, ova_no: int, ext: str) -> str:
+    return f"{clean_series} - OVA{ova_no:02d}{ext}"
 
 
-def movie_dirname(title: str, year: int) -> str:
-    t = sanitize_name(title)
-    return f"{t} ({year})"
+def movie_dirname(clean_title: str, year: int) -> str:
+    return f"{clean_title} ({year})"
 
 
-def movie_filename(title: str, year: int, ext: str) -> str:
-    t = sanitize_name(title)
-    return f"{t} ({year}){ext}"
+def movie_filename(clean_title: str, year: int, ext: str) -> str:
+    return f"{clean_title} ({year}){ext}"
 
 
 def build_destination(dec: Decision, cfg: Config, src: Path) -> Path:
     # Movies: OUTPUT/Movies/Title (Year)/Title (Year).ext
     if dec.kind == "movie" and dec.movie_title and dec.movie_year is not None:
         movies_root = cfg.dest_root / "Movies"
+        title = sanitize_name(dec.movie_title)
         return (
             movies_root
-            / movie_dirname(dec.movie_title, dec.movie_year)
-            / movie_filename(dec.movie_title, dec.movie_year, src.suffix)
+            / movie_dirname(title, dec.movie_year)
+            / movie_filename(title, dec.movie_year, src.suffix)
         )
 
     # Everything else uses series root
-    series_dir = cfg.dest_root / sanitize_name(dec.series_name)
+    series = sanitize_name(dec.series_name)
+    series_dir = cfg.dest_root / series
 
     # Episodes: Series/Season 01/Series - S01E01.ext
     if dec.kind == "episode" and dec.season is not None and dec.episode is not None:
         return (
             series_dir
             / season_dirname(dec.season)
-            / episode_filename(dec.series_name, dec.season, dec.episode, src.suffix)
+            / episode_filename(series, dec.season, dec.episode, src.suffix)
         )
 
     # OVA: Series/OVA/Series - OVA01.ext
     if dec.kind == "ova":
         ova_no = dec.episode if dec.episode is not None else 1
-        return series_dir / "OVA" / ova_filename(dec.series_name, ova_no, src.suffix)
+        return series_dir / "OVA" / ova_filename(series, ova_no, src.suffix)
 
     # Specials: Series/Season 00/<Series> - <original stem>.ext
     if dec.kind == "special":
         return (
             series_dir
             / season_dirname(cfg.specials_season)
-            / f"{sanitize_name(dec.series_name)} - {sanitize_name(src.stem)}{src.suffix}"
+            / f"{series} - {sanitize_name(src.stem)}{src.suffix}"
         )
 
     # Extras: Series/extras/<bucket>/<Series> - <original stem>.ext
@@ -79,7 +79,7 @@ def build_destination(dec: Decision, cfg: Config, src: Path) -> Path:
             series_dir
             / cfg.extras_dirname
             / sanitize_name(bucket)
-            / f"{sanitize_name(dec.series_name)} - {sanitize_name(src.stem)}{src.suffix}"
+            / f"{series} - {sanitize_name(src.stem)}{src.suffix}"
         )
 
     # Unknown: quarantine
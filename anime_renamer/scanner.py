@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from .config import Config
 
@@ -10,16 +11,40 @@ from .config import Config
 @dataclass(frozen=True)
 class MediaFile:
     path: Path
+    # Only filled in when the Perplexity API is on (used for its cache keys)
+    size: Optional[int] = None
+    mtime: Optional[int] = None
 
 
 def iter_media_files(cfg: Config) -> Iterable[MediaFile]:
-    allowed = {"." + ext.lower().lstrip(".") for ext in cfg.allowed_ext}
-
-    for p in cfg.inbox_dir.rglob("*"):
-        if not p.is_file():
+    allowed = {ext.lower().lstrip(".") for ext in cfg.allowed_ext}
+    want_stat = cfg.perplexity_enabled
+
+    # Explicit stack walk over os.scandir: DirEntry caches the file type from
+    # readdir, so we avoid a stat() per entry and only build Paths for matches.
+    # Unreadable or missing folders (including a misconfigured inbox) are skipped,
+    # as rglob did.
+    stack = [str(cfg.inbox_dir)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
             continue
-        if p.suffix.lower() in allowed:
-            yield MediaFile(path=p)
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.is_file():
+                    stem, dot, ext = e.name.rpartition(".")
+                    if not (stem and dot and ext.lower() in allowed):
+                        continue
+                    if not want_stat:
+                        yield MediaFile(path=Path(e.path))
+                        continue
+                    # DirEntry.stat() is cached on Windows (a real stat() on
+                    # Linux); either way it replaces the later one in _cache_key.
+                    st = e.stat()
+                    yield MediaFile(path=Path(e.path), size=st.st_size, mtime=int(st.st_mtime))
 
 
 def list_media_files(cfg: Config) -> List[MediaFile]: